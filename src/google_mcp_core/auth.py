@@ -1,27 +1,83 @@
 import os
 import json
+import functools
 import logging
 import tempfile
-from typing import List
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timedelta, timezone
+from typing import Dict, FrozenSet, List, Optional, Set, Tuple
 from google.auth.transport.requests import Request as GoogleRequest
 from google.oauth2.credentials import Credentials
 from google_auth_oauthlib.flow import InstalledAppFlow
 
 from google_mcp_core.exceptions import AuthenticationError
+from google_mcp_core.utils import jsonio
+from google_mcp_core.utils.paths import get_config_home
 
 logger = logging.getLogger(__name__)
 
+# In-process credential cache shared by every AuthManager, keyed by
+# (app_name, profile, scopes). Lets long-running servers skip token.json reads.
+# Entries hold the credentials with their granted scopes as a frozenset.
+_CredsKey = Tuple[str, str, FrozenSet[str]]
+_CREDS_CACHE: Dict[_CredsKey, Tuple[Credentials, FrozenSet[str]]] = {}
+_CACHE_LOCK = threading.Lock()
+
+# Credentials this close to expiry are refreshed in the background while the
+# current token keeps being served. google-auth already treats tokens as expired
+# 3m45s early, so the window has to be comfortably wider than that.
+_REFRESH_WINDOW = timedelta(minutes=10)
+_REFRESH_EXECUTOR = ThreadPoolExecutor(max_workers=1, thread_name_prefix="token-refresh")
+_refresh_in_flight: Set[_CredsKey] = set()
+
+
+def _utcnow() -> datetime:
+    """Naive UTC now, matching the convention of Credentials.expiry."""
+    return datetime.now(timezone.utc).replace(tzinfo=None)
+
+
+@functools.lru_cache(maxsize=8)
+def _profile_dir(config_home: str, app_name: str, profile: str) -> str:
+    return os.path.join(config_home, app_name, "profiles", profile)
+
+
+def _granted_scopes(creds: Credentials) -> FrozenSet[str]:
+    return frozenset(creds.scopes or ())
+
+
+def _same_token(
+    cached: Tuple[Credentials, FrozenSet[str]], creds: Credentials, granted: FrozenSet[str]
+) -> bool:
+    """Returns True if a reloaded token matches a still-valid cache entry."""
+    cached_creds, cached_scopes = cached
+    return (
+        cached_creds.valid
+        and cached_creds.token == creds.token
+        and cached_creds.refresh_token == creds.refresh_token
+        and cached_scopes == granted
+    )
+
+
+def _is_stale(creds: Credentials) -> bool:
+    """Returns True if valid credentials are close enough to expiry to refresh early."""
+    if not creds.valid or creds.expiry is None or not creds.refresh_token:
+        return False
+    return creds.expiry - _utcnow() < _REFRESH_WINDOW
+
 
 class AuthManager:
     def __init__(self, app_name: str = "google-personal-mcp"):
         self.app_name = app_name
+        # Resolved credentials.json paths, keyed by (profile, env var content)
+        self._cred_paths: Dict[Tuple[str, Optional[str]], str] = {}
 
     def get_config_dir(self, profile: str = "default") -> str:
-        """Returns the configuration directory for a given profile."""
-        base_dir = os.getenv("XDG_CONFIG_HOME", os.path.expanduser("~/.config"))
-        config_dir = os.path.join(base_dir, self.app_name, "profiles", profile)
-        os.makedirs(config_dir, exist_ok=True)
-        return config_dir
+        """Returns the configuration directory for a given profile.
+
+        The directory is not created here; it is created when a token is saved.
+        """
+        return _profile_dir(get_config_home(), self.app_name, profile)
 
     def get_credentials_path(self, profile: str = "default") -> str:
         """
@@ -33,6 +89,11 @@ class AuthManager:
         """
         # Check if credentials provided via environment variable (JSON content)
         env_creds = os.getenv("GOOGLE_PERSONAL_CREDENTIALS_JSON")
+        cache_key = (profile, env_creds or None)
+        cached = self._cred_paths.get(cache_key)
+        if cached:
+            return cached
+
         if env_creds:
             try:
                 # Validate it's valid JSON
@@ -44,22 +105,26 @@ class AuthManager:
                 temp_file.write(env_creds)
                 temp_file.close()
                 logger.debug("Using credentials from GOOGLE_PERSONAL_CREDENTIALS_JSON env var")
+                self._cred_paths[cache_key] = temp_file.name
                 return temp_file.name
             except json.JSONDecodeError as e:
-                logger.error(f"Invalid JSON in GOOGLE_PERSONAL_CREDENTIALS_JSON: {e}")
+                logger.error("Invalid JSON in GOOGLE_PERSONAL_CREDENTIALS_JSON: %s", e)
                 raise AuthenticationError(f"Invalid credentials JSON: {e}")
 
         # Otherwise, use file-based approach
         config_dir = self.get_config_dir(profile)
         path = os.path.join(config_dir, "credentials.json")
 
-        if not os.path.exists(path):
+        try:
+            os.stat(path)
+        except FileNotFoundError:
             raise FileNotFoundError(
                 f"credentials.json not found for profile '{profile}'.\n"
                 f"Expected location: {path}\n"
                 f"Place your OAuth 2.0 credentials file there and try again."
             )
-        logger.debug(f"Using credentials from file: {path}")
+        logger.debug("Using credentials from file: %s", path)
+        self._cred_paths[cache_key] = path
         return path
 
     def get_token_path(self, profile: str = "default") -> str:
@@ -85,20 +150,24 @@ class AuthManager:
                 logger.debug("Using token from GOOGLE_PERSONAL_TOKEN_JSON env var")
                 return temp_file.name
             except json.JSONDecodeError as e:
-                logger.error(f"Invalid JSON in GOOGLE_PERSONAL_TOKEN_JSON: {e}")
+                logger.error("Invalid JSON in GOOGLE_PERSONAL_TOKEN_JSON: %s", e)
                 raise AuthenticationError(f"Invalid token JSON: {e}")
 
         # Otherwise, use file-based approach
         config_dir = self.get_config_dir(profile)
         return os.path.join(config_dir, "token.json")
 
-    def get_credentials(self, profile: str = "default", scopes: List[str] = None) -> Credentials:
+    def get_credentials(
+        self, profile: str = "default", scopes: List[str] = None, use_cache: bool = True
+    ) -> Credentials:
         """
         Get Google API credentials for the given profile and scopes.
 
         Args:
             profile: Profile name (default: "default")
             scopes: List of OAuth scopes to request
+            use_cache: If False, ignore the in-process cache and reload token.json.
+                The cache entry is only replaced if the reloaded token differs.
 
         Returns:
             google.oauth2.credentials.Credentials object
@@ -113,54 +182,109 @@ class AuthManager:
                 "https://www.googleapis.com/auth/drive",
             ]
 
+        requested = frozenset(scopes)
+        key = (self.app_name, profile, requested)
+        with _CACHE_LOCK:
+            cached = _CREDS_CACHE.get(key) if use_cache else None
+        if cached is not None:
+            cached_creds, cached_scopes = cached
+            # Credentials.valid is already False within google-auth's refresh threshold
+            if cached_scopes >= requested and cached_creds.valid:
+                self._schedule_refresh(key, cached_creds)
+                return cached_creds
+
         try:
             token_path = self.get_token_path(profile)
         except Exception as e:
             raise AuthenticationError(f"Failed to get token path: {e}")
 
         creds = None
-        if os.path.exists(token_path):
-            try:
-                creds = Credentials.from_authorized_user_file(token_path)
-                if creds and not creds.has_scopes(scopes):
-                    logger.info(
-                        f"Token exists but lacks required scopes. Re-authenticating for profile '{profile}'..."
-                    )
-                    creds = None
-            except Exception as e:
-                logger.warning(f"Failed to load token from {token_path}: {e}")
+        try:
+            with open(token_path, "rb") as f:
+                creds = Credentials.from_authorized_user_info(jsonio.loads(f.read()))
+            if creds and not requested.issubset(_granted_scopes(creds)):
+                logger.info(
+                    "Token exists but lacks required scopes. Re-authenticating for profile '%s'...",
+                    profile,
+                )
                 creds = None
+        except FileNotFoundError:
+            # No token yet for this profile; fall through to the OAuth flow
+            creds = None
+        except Exception as e:
+            logger.warning("Failed to load token from %s: %s", token_path, e)
+            creds = None
 
         if not creds or not creds.valid:
             if creds and creds.expired and creds.refresh_token:
                 try:
-                    logger.debug(f"Refreshing token for profile '{profile}'...")
+                    logger.debug("Refreshing token for profile '%s'...", profile)
                     creds.refresh(GoogleRequest())
-                    logger.info(f"Token refreshed successfully for profile '{profile}'")
+                    logger.info("Token refreshed successfully for profile '%s'", profile)
                 except Exception as e:
-                    logger.warning(f"Failed to refresh token: {e}. Will re-authenticate.")
+                    logger.warning("Failed to refresh token: %s. Will re-authenticate.", e)
                     creds = None
 
             if not creds:
-                logger.info(f"Starting OAuth2 authentication for profile '{profile}'...")
+                logger.info("Starting OAuth2 authentication for profile '%s'...", profile)
                 try:
                     credentials_path = self.get_credentials_path(profile)
                     flow = InstalledAppFlow.from_client_secrets_file(credentials_path, scopes)
                     creds = flow.run_local_server(port=0)
-                    logger.info(f"OAuth2 authentication completed for profile '{profile}'")
+                    logger.info("OAuth2 authentication completed for profile '%s'", profile)
                 except Exception as e:
                     raise AuthenticationError(
                         f"OAuth2 authentication failed for profile '{profile}': {e}"
                     )
 
-            # Save token to profile directory
-            try:
-                # Only save if not from env var (env var tokens are temporary)
-                if not os.getenv("GOOGLE_PERSONAL_TOKEN_JSON"):
-                    with open(token_path, "w") as f:
-                        f.write(creds.to_json())
-                    logger.info(f"Authorization token saved to: {token_path}")
-            except Exception as e:
-                logger.warning(f"Failed to save token: {e}")
+            self._save_token(creds, token_path)
 
+        granted = _granted_scopes(creds)
+        with _CACHE_LOCK:
+            previous = _CREDS_CACHE.get(key)
+            if previous is not None and _same_token(previous, creds, granted):
+                # Keep the cached object so contexts holding it keep their transport
+                creds = previous[0]
+            else:
+                _CREDS_CACHE[key] = (creds, granted)
+        self._schedule_refresh(key, creds)
         return creds
+
+    def _save_token(self, creds: Credentials, token_path: str) -> None:
+        """Save token to profile directory."""
+        try:
+            # Only save if not from env var (env var tokens are temporary)
+            if not os.getenv("GOOGLE_PERSONAL_TOKEN_JSON"):
+                os.makedirs(os.path.dirname(token_path), exist_ok=True)
+                with open(token_path, "w") as f:
+                    f.write(creds.to_json())
+                logger.info("Authorization token saved to: %s", token_path)
+        except Exception as e:
+            logger.warning("Failed to save token: %s", e)
+
+    def _schedule_refresh(self, key: _CredsKey, creds: Credentials) -> None:
+        """Refresh stale credentials in the background, at most once per key."""
+        if not _is_stale(creds):
+            return
+        with _CACHE_LOCK:
+            if key in _refresh_in_flight:
+                return
+            _refresh_in_flight.add(key)
+        _REFRESH_EXECUTOR.submit(self._background_refresh, key, creds)
+
+    def _background_refresh(self, key: _CredsKey, creds: Credentials) -> None:
+        """Refresh credentials in place and persist them, off the request path."""
+        profile = key[1]
+        try:
+            logger.debug("Refreshing token for profile '%s' in the background...", profile)
+            creds.refresh(GoogleRequest())
+            self._save_token(creds, self.get_token_path(profile))
+            with _CACHE_LOCK:
+                _CREDS_CACHE[key] = (creds, _granted_scopes(creds))
+            logger.info("Token refreshed successfully for profile '%s'", profile)
+        except Exception as e:
+            # The current token stays in use; the next expiry falls back to inline refresh.
+            logger.warning("Background token refresh failed for profile '%s': %s", profile, e)
+        finally:
+            with _CACHE_LOCK:
+                _refresh_in_flight.discard(key)
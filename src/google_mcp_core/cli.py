@@ -4,12 +4,14 @@ Provides tools for managing Google Drive, Sheets, and authentication profiles.
 """
 
 import os
+import sys
 import logging
-from typing import Optional
+from itertools import chain
+from typing import Any, Dict, Iterable, Optional
 from cyclopts import App
-from datetime import datetime
+from datetime import datetime, timezone
 
-from google_mcp_core.context import GoogleContext
+from google_mcp_core.context import get_context
 from google_mcp_core.sheets import SheetsService
 from google_mcp_core.drive import DriveService
 from google_mcp_core.config import ConfigManager
@@ -22,6 +24,30 @@ logger = logging.getLogger(__name__)
 app = App(help_format="markdown")
 config_manager = ConfigManager()
 
+# Output rows are written in batches of this size rather than one print per row
+_FLUSH_EVERY = 1024
+
+_FILE_ROW = "{:<35} {:<40} {}\n".format
+
+
+def _write_lines(lines: Iterable[str]) -> None:
+    """Write newline-terminated lines to stdout in batches, flushing between batches."""
+    batch = []
+    for line in lines:
+        batch.append(line)
+        if len(batch) >= _FLUSH_EVERY:
+            sys.stdout.write("".join(batch))
+            sys.stdout.flush()
+            batch.clear()
+    if batch:
+        sys.stdout.write("".join(batch))
+
+
+def _format_file_row(f: Dict[str, Any]) -> str:
+    """Format a Drive file as an ID / type / name listing row."""
+    mtype = f.get("mimeType", "unknown").replace("application/vnd.google-apps.", "g:")
+    return _FILE_ROW(f["id"], mtype, f["name"])
+
 
 # --- Configuration Commands ---
 
@@ -115,23 +141,22 @@ def list_all_files(profile: str = "default"):
             "https://www.googleapis.com/auth/drive.file",
             "https://www.googleapis.com/auth/drive.readonly",
         ]
-        context = GoogleContext(profile=profile, scopes=scopes)
+        context = get_context(profile=profile, scopes=scopes)
         service = DriveService(context, allowed_folder_ids=[])
 
         print(f"\n📂 All Drive Files (profile: {profile})")
         print("-" * 100)
         files = service.list_all_files()
 
-        if not files:
+        # Files stream in page by page; print the header once the first one arrives
+        first = next(files, None)
+        if first is None:
             print("No files found.")
             return
 
         print(f"{'ID':<35} {'Type':<40} {'Name'}")
         print("-" * 100)
-        for f in files:
-            mtype = f.get("mimeType", "unknown")
-            mtype = mtype.replace("application/vnd.google-apps.", "g:")
-            print(f"{f['id']:<35} {mtype:<40} {f['name']}")
+        _write_lines(map(_format_file_row, chain([first], files)))
 
     except Exception as e:
         print(f"Error: {e}")
@@ -148,7 +173,7 @@ def list_files(folder: Optional[str] = None, profile: str = "default"):
     try:
         folder_alias, folder_id = _resolve_folder(folder, profile)
 
-        context = GoogleContext(profile=profile)
+        context = get_context(profile=profile)
         allowed_ids = config_manager.get_allowed_folder_ids(profile)
         service = DriveService(context, allowed_folder_ids=allowed_ids)
 
@@ -162,13 +187,8 @@ def list_files(folder: Optional[str] = None, profile: str = "default"):
 
         print(f"{'ID':<35} {'Type':<40} {'Name'}")
         print("-" * 100)
-        for f in files:
-            mtype = f.get("mimeType", "unknown")
-            mtype = mtype.replace("application/vnd.google-apps.", "g:")
-            print(f"{f['id']:<35} {mtype:<40} {f['name']}")
+        _write_lines(map(_format_file_row, files))
 
-    except ValueError as e:
-        print(f"❌ Error: {e}")
     except Exception as e:
         print(f"❌ Error: {e}")
 
@@ -194,7 +214,7 @@ def get_file(
         if local_file is None:
             local_file = os.path.basename(remote_file)
 
-        context = GoogleContext(profile=profile)
+        context = get_context(profile=profile)
         allowed_ids = config_manager.get_allowed_folder_ids(profile)
         service = DriveService(context, allowed_folder_ids=allowed_ids)
 
@@ -202,12 +222,6 @@ def get_file(
         service.download_file_by_name(folder_id, remote_file, local_file)
         print(f"✅ Downloaded to: {local_file}")
 
-    except FileExistsError as e:
-        print(f"❌ Error: {e}")
-    except FileNotFoundError as e:
-        print(f"❌ Error: {e}")
-    except ValueError as e:
-        print(f"❌ Error: {e}")
     except Exception as e:
         print(f"❌ Error: {e}")
 
@@ -237,7 +251,7 @@ def put_file(
         if remote_file is None:
             remote_file = os.path.basename(local_file)
 
-        context = GoogleContext(profile=profile)
+        context = get_context(profile=profile)
         allowed_ids = config_manager.get_allowed_folder_ids(profile)
         service = DriveService(context, allowed_folder_ids=allowed_ids)
 
@@ -245,8 +259,6 @@ def put_file(
         result = service.upload_file(local_file, folder_id, remote_file)
         print(f"✅ Uploaded successfully (ID: {result['id']})")
 
-    except ValueError as e:
-        print(f"❌ Error: {e}")
     except Exception as e:
         print(f"❌ Error: {e}")
 
@@ -267,7 +279,7 @@ def remove_file(
     try:
         folder_alias, folder_id = _resolve_folder(folder, profile)
 
-        context = GoogleContext(profile=profile)
+        context = get_context(profile=profile)
         allowed_ids = config_manager.get_allowed_folder_ids(profile)
         service = DriveService(context, allowed_folder_ids=allowed_ids)
 
@@ -275,10 +287,6 @@ def remove_file(
         service.remove_file_by_name(folder_id, remote_file)
         print(f"✅ File removed successfully")
 
-    except FileNotFoundError as e:
-        print(f"❌ Error: {e}")
-    except ValueError as e:
-        print(f"❌ Error: {e}")
     except Exception as e:
         print(f"❌ Error: {e}")
 
@@ -293,7 +301,7 @@ def list_tabs(sheet_alias: str, profile: str = "default"):
     """List all tabs (sheets) within a configured spreadsheet."""
     try:
         sheet_config = config_manager.get_sheet_resource(sheet_alias)
-        context = GoogleContext(profile=profile)
+        context = get_context(profile=profile)
         service = SheetsService(context)
 
         print(f"\n📊 Tabs in '{sheet_alias}' (profile: {profile})")
@@ -304,8 +312,7 @@ def list_tabs(sheet_alias: str, profile: str = "default"):
             print("No tabs found.")
             return
 
-        for i, tab in enumerate(tabs, 1):
-            print(f"{i}. {tab}")
+        _write_lines(f"{i}. {tab}\n" for i, tab in enumerate(tabs, 1))
 
     except Exception as e:
         print(f"Error: {e}")
@@ -316,7 +323,7 @@ def get_status(sheet_alias: str, range_name: str = "README!A1", profile: str = "
     """Get the status (values) of a sheet range."""
     try:
         sheet_config = config_manager.get_sheet_resource(sheet_alias)
-        context = GoogleContext(profile=profile)
+        context = get_context(profile=profile)
         service = SheetsService(context)
 
         print(f"\n📋 Status from '{sheet_alias}' {range_name} (profile: {profile})")
@@ -339,7 +346,7 @@ def get_prompts(sheet_alias: str, sheet_tab_name: str, profile: str = "default")
     """Get all prompts from a sheet tab."""
     try:
         sheet_config = config_manager.get_sheet_resource(sheet_alias)
-        context = GoogleContext(profile=profile)
+        context = get_context(profile=profile)
         service = SheetsService(context)
 
         print(f"\n💭 Prompts from '{sheet_alias}' - {sheet_tab_name} (profile: {profile})")
@@ -352,28 +359,23 @@ def get_prompts(sheet_alias: str, sheet_tab_name: str, profile: str = "default")
             print("No prompts found.")
             return
 
-        headers = [
-            "Name",
-            "Content",
-            "Created By",
-            "Created At",
-            "Last Modified By",
-            "Last Modified At",
-        ]
-
-        # Print header
+        # Print header (only Name, Content and Created By are displayed)
         print(f"{'Name':<25} {'Content':<50} {'Created By':<15}")
         print("-" * 100)
 
+        width = 3
+        lines = []
         for row in raw_values[1:]:
-            name = row[0] if len(row) > 0 else ""
-            content = row[1] if len(row) > 1 else ""
-            author = row[2] if len(row) > 2 else ""
+            if len(row) < width:
+                row = row + [""] * (width - len(row))
+            name, content, author = row[:width]
 
             # Truncate content for display
-            content_display = (content[:47] + "...") if len(content) > 50 else content
+            if len(content) > 50:
+                content = content[:47] + "..."
 
-            print(f"{name:<25} {content_display:<50} {author:<15}")
+            lines.append(f"{name:<25} {content:<50} {author:<15}\n")
+        _write_lines(lines)
 
     except Exception as e:
         print(f"Error: {e}")
@@ -391,10 +393,10 @@ def insert_prompt(
     """Insert a prompt into a sheet tab."""
     try:
         sheet_config = config_manager.get_sheet_resource(sheet_alias)
-        context = GoogleContext(profile=profile)
+        context = get_context(profile=profile)
         service = SheetsService(context)
 
-        timestamp = datetime.now().isoformat()
+        timestamp = datetime.now(timezone.utc).isoformat(timespec="seconds")
         values = [prompt_name, content, author, timestamp, author, timestamp]
         service.insert_row_at_top(sheet_config.id, sheet_tab_name, values)
 
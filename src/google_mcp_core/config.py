@@ -1,11 +1,12 @@
 import os
-import json
 import logging
 from pathlib import Path
 from typing import Dict, List, Optional
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field
 
 from google_mcp_core.exceptions import ConfigurationError
+from google_mcp_core.utils import jsonio
+from google_mcp_core.utils.paths import get_config_home
 
 logger = logging.getLogger(__name__)
 
@@ -57,6 +58,8 @@ def load_env_file(env_path: Optional[str] = None) -> None:
 class ResourceConfig(BaseModel):
     """Configuration for a Google resource (sheet or folder)."""
 
+    model_config = ConfigDict(frozen=True)
+
     id: str
     profile: str = "default"
     description: Optional[str] = None
@@ -88,10 +91,15 @@ class AppConfig(BaseModel):
 
 
 class ConfigManager:
+    __slots__ = ("config_path", "config", "_config_mtime", "_allowed_by_profile", "_all_allowed")
+
     def __init__(self, config_path: Optional[str] = None):
         # Load .env file before determining config path (allows env var overrides)
         load_env_file()
         self.config_path = config_path or self._get_default_config_path()
+        self._config_mtime: Optional[int] = None
+        self._allowed_by_profile: Dict[str, List[str]] = {}
+        self._all_allowed: List[str] = []
         self.config = self._load_config()
 
     def _get_default_config_path(self) -> str:
@@ -111,7 +119,7 @@ class ConfigManager:
 
         # Check environment-specific config
         env = os.getenv("GOOGLE_MCP_ENV", "default")
-        base_dir = os.getenv("XDG_CONFIG_HOME", os.path.expanduser("~/.config"))
+        base_dir = get_config_home()
         env_config = os.path.join(base_dir, "google-personal-mcp", f"config.{env}.json")
 
         if env != "default" and os.path.exists(env_config):
@@ -122,15 +130,33 @@ class ConfigManager:
         default_config = os.path.join(base_dir, "google-personal-mcp", "config.json")
         return default_config
 
+    def _get_config_mtime(self) -> Optional[int]:
+        """Returns the config file's mtime in nanoseconds, or None if it does not exist."""
+        try:
+            return os.stat(self.config_path).st_mtime_ns
+        except OSError:
+            return None
+
+    def _index_folders(self, config: AppConfig) -> None:
+        """Precompute allowed folder IDs, overall and grouped by profile."""
+        self._all_allowed = []
+        self._allowed_by_profile = {}
+        for resource in config.drive_folders.values():
+            self._all_allowed.append(resource.id)
+            self._allowed_by_profile.setdefault(resource.profile, []).append(resource.id)
+
     def _load_config(self) -> AppConfig:
         """Load configuration from file."""
-        if os.path.exists(self.config_path):
+        self._config_mtime = self._get_config_mtime()
+        if self._config_mtime is not None:
             try:
-                with open(self.config_path, "r") as f:
-                    data = json.load(f)
+                with open(self.config_path, "rb") as f:
+                    data = jsonio.loads(f.read())
                 logger.info(f"Loaded configuration from {self.config_path}")
-                return AppConfig(**data)
-            except json.JSONDecodeError as e:
+                config = AppConfig.model_validate(data)
+                self._index_folders(config)
+                return config
+            except jsonio.JSONDecodeError as e:
                 logger.error(f"Invalid JSON in config file {self.config_path}: {e}")
                 raise ConfigurationError(f"Invalid JSON in config file: {e}")
             except Exception as e:
@@ -138,39 +164,58 @@ class ConfigManager:
                 raise ConfigurationError(f"Failed to load config: {e}")
         else:
             logger.debug(f"Config file not found at {self.config_path}, using defaults")
-            return AppConfig()
+            config = AppConfig()
+            self._index_folders(config)
+            return config
+
+    def _maybe_reload(self):
+        """Reload configuration if the file changed on disk since it was last read."""
+        if self._get_config_mtime() == self._config_mtime:
+            return
+        try:
+            self.config = self._load_config()
+        except ConfigurationError as e:
+            # Keep serving the last good configuration (e.g. file is mid-write)
+            logger.warning(f"Keeping previous configuration, reload failed: {e}")
 
     def get_sheet_resource(self, alias: str) -> ResourceConfig:
         """Get sheet resource by alias."""
+        self._maybe_reload()
         if alias in self.config.sheets:
             return self.config.sheets[alias]
         raise ConfigurationError(f"Sheet alias '{alias}' not found in configuration.")
 
     def get_folder_resource(self, alias: str) -> ResourceConfig:
         """Get folder resource by alias."""
+        self._maybe_reload()
         if alias in self.config.drive_folders:
             return self.config.drive_folders[alias]
         raise ConfigurationError(f"Folder alias '{alias}' not found in configuration.")
 
     def get_allowed_folder_ids(self, profile_name: Optional[str] = None) -> List[str]:
         """Returns folder IDs, optionally filtered by profile."""
+        self._maybe_reload()
         if profile_name:
-            return [r.id for r in self.config.drive_folders.values() if r.profile == profile_name]
-        return [r.id for r in self.config.drive_folders.values()]
+            return list(self._allowed_by_profile.get(profile_name, []))
+        return list(self._all_allowed)
 
     def list_sheets(self, profile_name: Optional[str] = None) -> Dict[str, ResourceConfig]:
         """Returns configured sheets, optionally filtered by profile."""
+        self._maybe_reload()
         if profile_name:
             return {k: v for k, v in self.config.sheets.items() if v.profile == profile_name}
         return self.config.sheets
 
     def list_folders(self, profile_name: Optional[str] = None) -> Dict[str, ResourceConfig]:
         """Returns configured drive folders, optionally filtered by profile."""
+        self._maybe_reload()
         if profile_name:
             return {k: v for k, v in self.config.drive_folders.items() if v.profile == profile_name}
         return self.config.drive_folders
 
     def save_config(self):
         os.makedirs(os.path.dirname(self.config_path), exist_ok=True)
-        with open(self.config_path, "w") as f:
-            f.write(self.config.model_dump_json(indent=2))
+        with open(self.config_path, "wb") as f:
+            f.write(jsonio.dumps_pretty(self.config.model_dump(mode="json")))
+        self._config_mtime = self._get_config_mtime()
+        self._index_folders(self.config)
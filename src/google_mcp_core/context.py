@@ -1,7 +1,15 @@
-from typing import List, Optional
+import threading
+from typing import Dict, FrozenSet, List, Optional, Tuple
+from google_auth_httplib2 import AuthorizedHttp
 from googleapiclient.discovery import build
+from googleapiclient.http import build_http
 from .auth import AuthManager
 
+DEFAULT_SCOPES = [
+    "https://www.googleapis.com/auth/spreadsheets",
+    "https://www.googleapis.com/auth/drive",
+]
+
 
 class GoogleContext:
     def __init__(
@@ -11,24 +19,41 @@ class GoogleContext:
         app_name: str = "google-personal-mcp",
     ):
         self.profile = profile
-        self.scopes = scopes or [
-            "https://www.googleapis.com/auth/spreadsheets",
-            "https://www.googleapis.com/auth/drive",
-        ]
+        self.scopes = scopes or list(DEFAULT_SCOPES)
         self.auth_manager = AuthManager(app_name=app_name)
-        self._creds = None
+        self._http = None
         self._services = {}
 
     @property
     def credentials(self):
-        if not self._creds:
-            self._creds = self.auth_manager.get_credentials(self.profile, self.scopes)
-        return self._creds
+        """Current credentials for this context's profile and scopes.
+
+        Resolved through AuthManager on every access, which is a cache lookup
+        once loaded. This keeps background refreshes scheduled and picks up
+        tokens reloaded from disk, even for contexts that live for the process.
+        """
+        return self.auth_manager.get_credentials(self.profile, self.scopes)
+
+    @property
+    def http(self):
+        """Authorized transport shared by all services of this context.
+
+        Reusing one transport keeps connections alive across API calls. It is
+        not thread-safe, so requests on one context must not run concurrently.
+        The transport is rebuilt, and the services with it, whenever
+        AuthManager returns a different Credentials object.
+        """
+        creds = self.credentials
+        if self._http is None or self._http.credentials is not creds:
+            self._http = AuthorizedHttp(creds, http=build_http())
+            self._services = {}
+        return self._http
 
     def get_service(self, service_name: str, version: str):
+        http = self.http
         key = (service_name, version)
         if key not in self._services:
-            self._services[key] = build(service_name, version, credentials=self.credentials)
+            self._services[key] = build(service_name, version, http=http)
         return self._services[key]
 
     @property
@@ -38,3 +63,37 @@ class GoogleContext:
     @property
     def drive(self):
         return self.get_service("drive", "v3")
+
+
+_CONTEXT_CACHE: Dict[Tuple[str, str, FrozenSet[str]], GoogleContext] = {}
+_CONTEXT_LOCK = threading.Lock()
+
+
+def get_context(
+    profile: str = "default",
+    scopes: Optional[List[str]] = None,
+    app_name: str = "google-personal-mcp",
+) -> GoogleContext:
+    """
+    Get the shared GoogleContext for a profile and scope set.
+
+    Contexts are created on first use and reused afterwards, so discovery
+    documents are parsed and API clients built once per process rather than
+    once per call. Services are still built lazily on first access.
+
+    Args:
+        profile: Profile name (default: "default")
+        scopes: OAuth scopes (default: Sheets and Drive)
+        app_name: Application name used for the config directory
+
+    Returns:
+        GoogleContext shared by all callers with the same arguments
+    """
+    scopes = scopes or DEFAULT_SCOPES
+    key = (app_name, profile, frozenset(scopes))
+    with _CONTEXT_LOCK:
+        context = _CONTEXT_CACHE.get(key)
+        if context is None:
+            context = GoogleContext(profile=profile, scopes=list(scopes), app_name=app_name)
+            _CONTEXT_CACHE[key] = context
+        return context
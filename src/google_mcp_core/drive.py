@@ -1,18 +1,62 @@
 import os
 import io
+import time
 import logging
-from typing import List, Dict, Any, Optional
-from googleapiclient.http import MediaFileUpload, MediaIoBaseDownload
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from typing import List, Dict, Any, Iterator, Optional, Tuple
+from google_auth_httplib2 import AuthorizedHttp
+from googleapiclient.http import MediaFileUpload, MediaIoBaseDownload, build_http
 from .context import GoogleContext
 
 logger = logging.getLogger(__name__)
 
+# How long a file's parent folders are trusted before re-checking with Drive
+PARENT_CACHE_TTL = 300.0
+# Most files whose parents are remembered; the least recently used are dropped
+PARENT_CACHE_SIZE = 1024
+
+# Bytes fetched per HTTP request when downloading (library default is 100 KiB)
+DOWNLOAD_CHUNK_SIZE = 16 * 1024 * 1024
+DOWNLOAD_BUFFER_SIZE = 1 << 20
+
+_LIST_FIELDS = "files(id, name, mimeType, size, modifiedTime)"
+_LIST_ALL_FIELDS = "nextPageToken, files(id, name, mimeType)"
+_FIND_FIELDS = "files(id, name)"
+_QUERY_TMPL = "'{}' in parents and trashed = false"
+_NAME_QUERY_TMPL = "'{}' in parents and name='{}' and trashed = false"
+
 
 class DriveService:
     def __init__(self, context: GoogleContext, allowed_folder_ids: Optional[List[str]] = None):
         self.context = context
         self.service = context.drive
-        self.allowed_folder_ids = allowed_folder_ids or []
+        # files() builds a new Resource object on every call; build it once
+        self._files = self.service.files()
+        self.allowed_folder_ids = frozenset(allowed_folder_ids or ())
+        # file_id -> (monotonic fetch time, parent folder IDs), oldest use first
+        self._parent_cache: "OrderedDict[str, Tuple[float, List[str]]]" = OrderedDict()
+
+    def _remember_parents(self, file_id: str, fetched_at: float, parents: List[str]):
+        """Caches a file's parents, evicting the least recently used entries."""
+        self._parent_cache[file_id] = (fetched_at, parents)
+        self._parent_cache.move_to_end(file_id)
+        while len(self._parent_cache) > PARENT_CACHE_SIZE:
+            self._parent_cache.popitem(last=False)
+
+    def _get_parents(self, file_id: str) -> List[str]:
+        """Returns a file's parent folder IDs, using a short-lived cache."""
+        cached = self._parent_cache.get(file_id)
+        now = time.monotonic()
+        if cached:
+            if now - cached[0] < PARENT_CACHE_TTL:
+                self._parent_cache.move_to_end(file_id)
+                return cached[1]
+            del self._parent_cache[file_id]
+        file = self._files.get(fileId=file_id, fields="parents").execute()
+        parents = file.get("parents", [])
+        self._remember_parents(file_id, now, parents)
+        return parents
 
     def _verify_access(self, file_id: str = None, parent_id: str = None):
         """Verifies if the operation is within allowed folders."""
@@ -27,45 +71,60 @@ class DriveService:
         # If we only have a file_id, we should check its parents
         if file_id:
             try:
-                file = self.service.files().get(fileId=file_id, fields="parents").execute()
-                parents = file.get("parents", [])
-                if not any(p in self.allowed_folder_ids for p in parents):
-                    raise PermissionError(
-                        f"Access to file {file_id} is not allowed (not in allowed folders)."
-                    )
+                parents = self._get_parents(file_id)
             except Exception as e:
                 # If we can't get parents (e.g. 404), we can't verify, so deny.
                 raise PermissionError(f"Could not verify access for file {file_id}: {e}")
+            if self.allowed_folder_ids.isdisjoint(parents):
+                raise PermissionError(
+                    f"Access to file {file_id} is not allowed (not in allowed folders)."
+                )
 
     def list_files(self, folder_id: str) -> List[Dict[str, Any]]:
         self._verify_access(parent_id=folder_id)
-        query = f"'{folder_id}' in parents and trashed = false"
-        results = (
-            self.service.files()
-            .list(q=query, fields="files(id, name, mimeType, size, modifiedTime)")
-            .execute()
-        )
+        query = _QUERY_TMPL.format(folder_id)
+        results = self._files.list(q=query, fields=_LIST_FIELDS).execute()
         return results.get("files", [])
 
-    def list_all_files(self, pageSize: int = 100) -> List[Dict[str, Any]]:
-        """Lists all files accessible by the current credentials. (Admin/Script use)."""
-        results = (
-            self.service.files()
-            .list(pageSize=pageSize, fields="nextPageToken, files(id, name, mimeType)")
-            .execute()
-        )
-        return results.get("files", [])
+    def list_all_files(self, pageSize: int = 100) -> Iterator[Dict[str, Any]]:
+        """Lists all files accessible by the current credentials. (Admin/Script use).
+
+        Follows nextPageToken across all pages. Files are yielded as each page
+        arrives, and the next page is fetched in the background while the caller
+        consumes the current one. Only one request is in flight at a time, since
+        each page token comes from the previous response.
+
+        httplib2 transports are not thread-safe, so the listing runs on its own
+        transport rather than the one shared by the context's services.
+        """
+        listing_http = AuthorizedHttp(self.context.credentials, http=build_http())
+
+        def fetch(page_token: Optional[str]) -> Dict[str, Any]:
+            return self._files.list(
+                pageSize=pageSize, pageToken=page_token, fields=_LIST_ALL_FIELDS
+            ).execute(http=listing_http)
+
+        with ThreadPoolExecutor(max_workers=1) as executor:
+            results = fetch(None)
+            while True:
+                page_token = results.get("nextPageToken")
+                next_page = executor.submit(fetch, page_token) if page_token else None
+                yield from results.get("files", [])
+                if next_page is None:
+                    return
+                results = next_page.result()
 
     def download_file(self, file_id: str, local_path: str):
         self._verify_access(file_id=file_id)
-        request = self.service.files().get_media(fileId=file_id)
-        fh = io.FileIO(local_path, "wb")
-        downloader = MediaIoBaseDownload(fh, request)
-        done = False
-        while done is False:
-            status, done = downloader.next_chunk()
-            logger.debug(f"Download {int(status.progress() * 100)}%.")
-        fh.close()
+        request = self._files.get_media(fileId=file_id)
+        with io.BufferedWriter(io.FileIO(local_path, "wb"), buffer_size=DOWNLOAD_BUFFER_SIZE) as fh:
+            downloader = MediaIoBaseDownload(fh, request, chunksize=DOWNLOAD_CHUNK_SIZE)
+            log_progress = logger.isEnabledFor(logging.DEBUG)
+            done = False
+            while done is False:
+                status, done = downloader.next_chunk()
+                if log_progress:
+                    logger.debug("Download %d%%.", int(status.progress() * 100))
 
     def upload_file(
         self, local_path: str, folder_id: str, filename: Optional[str] = None
@@ -74,14 +133,15 @@ class DriveService:
         filename = filename or os.path.basename(local_path)
         file_metadata = {"name": filename, "parents": [folder_id]}
         media = MediaFileUpload(local_path, resumable=True)
-        file = (
-            self.service.files().create(body=file_metadata, media_body=media, fields="id").execute()
-        )
+        file = self._files.create(body=file_metadata, media_body=media, fields="id").execute()
+        if file.get("id"):
+            self._remember_parents(file["id"], time.monotonic(), [folder_id])
         return file
 
     def remove_file(self, file_id: str):
         self._verify_access(file_id=file_id)
-        self.service.files().delete(fileId=file_id).execute()
+        self._files.delete(fileId=file_id).execute()
+        self._parent_cache.pop(file_id, None)
 
     def find_file_by_name(self, folder_id: str, filename: str) -> Optional[str]:
         """Find a file by name in a specific folder and return its file ID.
@@ -97,12 +157,8 @@ class DriveService:
             ValueError: If multiple files with same name exist
         """
         self._verify_access(parent_id=folder_id)
-        query = f"'{folder_id}' in parents and name='{filename}' and trashed = false"
-        results = (
-            self.service.files()
-            .list(q=query, fields="files(id, name)")
-            .execute()
-        )
+        query = _NAME_QUERY_TMPL.format(folder_id, filename)
+        results = self._files.list(q=query, fields=_FIND_FIELDS).execute()
         files = results.get("files", [])
 
         if len(files) == 0:
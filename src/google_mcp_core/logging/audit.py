@@ -7,6 +7,8 @@ from datetime import datetime, timezone
 from typing import Optional, Dict, Any
 from pathlib import Path
 
+from google_mcp_core.utils.paths import get_config_home
+
 logger = logging.getLogger(__name__)
 
 
@@ -29,7 +31,7 @@ class AuditLogger:
 
     def _get_default_log_path(self) -> str:
         """Get default audit log path: ~/.config/google-personal-mcp/audit.log"""
-        base_dir = os.getenv("XDG_CONFIG_HOME", os.path.expanduser("~/.config"))
+        base_dir = get_config_home()
         return os.path.join(base_dir, "google-personal-mcp", "audit.log")
 
     def _ensure_log_file_exists(self) -> None:
@@ -0,0 +1,23 @@
+"""Configuration directory resolution."""
+
+import functools
+import os
+from typing import Optional
+
+
+@functools.lru_cache(maxsize=4)
+def _resolve_config_home(xdg_config_home: Optional[str]) -> str:
+    return xdg_config_home or os.path.expanduser("~/.config")
+
+
+def get_config_home() -> str:
+    """
+    Get the base configuration directory.
+
+    Uses XDG_CONFIG_HOME if set, otherwise ~/.config. The expansion is cached
+    per XDG_CONFIG_HOME value, so changing the variable still takes effect.
+
+    Returns:
+        Absolute path of the base configuration directory
+    """
+    return _resolve_config_home(os.getenv("XDG_CONFIG_HOME"))
@@ -1,10 +1,12 @@
 import os
 import logging
+from itertools import zip_longest
 from typing import Optional, Tuple, Dict, Any
 from mcp.server import FastMCP
-from datetime import datetime
+from datetime import datetime, timezone
 
-from google_mcp_core.context import GoogleContext
+from google_mcp_core.auth import AuthManager
+from google_mcp_core.context import DEFAULT_SCOPES, get_context
 from google_mcp_core.sheets import SheetsService
 from google_mcp_core.drive import DriveService
 from google_mcp_core.config import ConfigManager
@@ -30,19 +32,41 @@ audit_logger = AuditLogger(
 # --- MCP Server ---
 mcp = FastMCP("Google Personal MCP Server")
 
+# Column headers of a prompts tab (range A:F)
+PROMPT_HEADERS = (
+    "Name",
+    "Content",
+    "Created By",
+    "Created At",
+    "Last Modified By",
+    "Last Modified At",
+)
+
+
+# Drive services are kept across tool calls so their file-parent caches persist.
+# Keyed by allowed folder IDs too, so a config reload yields a fresh service.
+_drive_services: Dict[Tuple[str, Tuple[str, ...]], DriveService] = {}
+
 
 def get_sheets_service(alias: str) -> Tuple[SheetsService, str]:
     resource = config_manager.get_sheet_resource(alias)
-    context = GoogleContext(profile=resource.profile)
+    context = get_context(profile=resource.profile)
     return SheetsService(context), resource.id
 
 
 def get_drive_service(alias: str) -> Tuple[DriveService, str]:
     resource = config_manager.get_folder_resource(alias)
-    context = GoogleContext(profile=resource.profile)
     # Important: The drive service should be restricted to IDs for THIS profile
     allowed_ids = config_manager.get_allowed_folder_ids(resource.profile)
-    return DriveService(context, allowed_folder_ids=allowed_ids), resource.id
+    key = (resource.profile, tuple(allowed_ids))
+    context = get_context(profile=resource.profile)
+    # Resolving the client re-checks credentials, rebuilding it if they were reloaded
+    drive = context.drive
+    service = _drive_services.get(key)
+    if service is None or service.service is not drive:
+        service = DriveService(context, allowed_folder_ids=allowed_ids)
+        _drive_services[key] = service
+    return service, resource.id
 
 
 # --- Configuration Tools ---
@@ -122,16 +146,17 @@ def health_check() -> dict:
 
         # Check each profile
         all_profiles = set()
-        for sheet_config in config_manager.config.sheets.values():
+        for sheet_config in config_manager.list_sheets().values():
             all_profiles.add(sheet_config.profile)
-        for folder_config in config_manager.config.drive_folders.values():
+        for folder_config in config_manager.list_folders().values():
             all_profiles.add(folder_config.profile)
 
         for profile in all_profiles:
             try:
-                context = GoogleContext(profile=profile)
-                # Try to get credentials (this validates they work)
-                _ = context.credentials
+                # Reload the token from disk (this validates it still works), bypassing
+                # the in-process cache so a deleted or replaced token is noticed. An
+                # unchanged token keeps the cached credentials and shared transports.
+                AuthManager().get_credentials(profile, DEFAULT_SCOPES, use_cache=False)
                 components[f"auth_{profile}"] = {
                     "status": "ok",
                     "profile": profile,
@@ -293,7 +318,7 @@ def insert_prompt(
     """Inserts a prompt into a specific sheet tab."""
     try:
         service, spreadsheet_id = get_sheets_service(sheet_alias)
-        timestamp = datetime.now().isoformat()
+        timestamp = datetime.now(timezone.utc).isoformat(timespec="seconds")
         values = [prompt_name, content, author, timestamp, author, timestamp]
         service.insert_row_at_top(spreadsheet_id, sheet_tab_name, values)
         return {"status": "success", "message": "Prompt inserted successfully."}
@@ -312,18 +337,11 @@ def get_prompts(sheet_tab_name: str, sheet_alias: str) -> dict:
         if not raw_values:
             return {"status": "success", "prompts": []}
 
-        headers = [
-            "Name",
-            "Content",
-            "Created By",
-            "Created At",
-            "Last Modified By",
-            "Last Modified At",
-        ]
+        # Rows never exceed the headers since the range is limited to A:F
         prompts = []
+        prompts_append = prompts.append
         for row in raw_values[1:]:
-            prompt_dict = {headers[i]: row[i] if i < len(row) else "" for i in range(len(headers))}
-            prompts.append(prompt_dict)
+            prompts_append(dict(zip_longest(PROMPT_HEADERS, row, fillvalue="")))
 
         return {"status": "success", "prompts": prompts}
     except Exception as e:
@@ -3,8 +3,56 @@
 import pytest
 import json
 import tempfile
+from datetime import timedelta
 from pathlib import Path
 
+from google_mcp_core import auth
+from google_mcp_core import context as context_module
+from google_mcp_core.context import DEFAULT_SCOPES
+
+
+@pytest.fixture(autouse=True)
+def reset_google_caches():
+    """Ensure each test starts with no cached credentials or shared contexts."""
+    auth._CREDS_CACHE.clear()
+    context_module._CONTEXT_CACHE.clear()
+    yield
+    auth._CREDS_CACHE.clear()
+    context_module._CONTEXT_CACHE.clear()
+
+
+@pytest.fixture
+def token_file(tmp_path, monkeypatch):
+    """Factory writing token.json for a profile under a temporary config home."""
+    monkeypatch.setenv("XDG_CONFIG_HOME", str(tmp_path))
+    monkeypatch.delenv("GOOGLE_PERSONAL_TOKEN_JSON", raising=False)
+
+    def write(
+        expires_in=timedelta(hours=1),
+        scopes=DEFAULT_SCOPES,
+        token="access-token",
+        profile="default",
+    ):
+        profile_dir = tmp_path / "google-personal-mcp" / "profiles" / profile
+        profile_dir.mkdir(parents=True, exist_ok=True)
+        path = profile_dir / "token.json"
+        expiry = auth._utcnow() + expires_in
+        path.write_text(
+            json.dumps(
+                {
+                    "token": token,
+                    "refresh_token": "refresh-token",
+                    "client_id": "client-id",
+                    "client_secret": "client-secret",
+                    "scopes": scopes,
+                    "expiry": expiry.isoformat() + "Z",
+                }
+            )
+        )
+        return path
+
+    return write
+
 
 @pytest.fixture
 def temp_config_dir():
@@ -0,0 +1,224 @@
+"""Tests for credential loading and caching."""
+
+import os
+from datetime import timedelta
+
+import pytest
+from google.auth._helpers import REFRESH_THRESHOLD
+
+from google_mcp_core import auth
+from google_mcp_core.auth import AuthManager
+from google_mcp_core.context import DEFAULT_SCOPES
+
+
+class TestCredentialCache:
+    """Test in-process caching of credentials."""
+
+    def test_second_call_skips_disk(self, token_file, mocker):
+        """Test that a fresh cached token is returned without re-reading token.json."""
+        token_file()
+        manager = AuthManager()
+
+        first = manager.get_credentials(scopes=DEFAULT_SCOPES)
+        spy = mocker.spy(manager, "get_token_path")
+        second = manager.get_credentials(scopes=DEFAULT_SCOPES)
+
+        assert second is first
+        spy.assert_not_called()
+
+    def test_cache_shared_across_managers(self, token_file):
+        """Test that separate AuthManager instances share the cache."""
+        token_file()
+
+        first = AuthManager().get_credentials(scopes=DEFAULT_SCOPES)
+        second = AuthManager().get_credentials(scopes=DEFAULT_SCOPES)
+
+        assert second is first
+
+    def test_cache_keyed_by_scopes(self, token_file):
+        """Test that a different scope set does not hit another entry."""
+        token_file()
+        manager = AuthManager()
+
+        manager.get_credentials(scopes=DEFAULT_SCOPES)
+
+        assert len(auth._CREDS_CACHE) == 1
+        key = next(iter(auth._CREDS_CACHE))
+        assert key == ("google-personal-mcp", "default", frozenset(DEFAULT_SCOPES))
+
+    def test_cache_stores_granted_scopes(self, token_file):
+        """Test that cache entries carry the token's granted scopes as a set."""
+        token_file()
+
+        creds = AuthManager().get_credentials(scopes=DEFAULT_SCOPES)
+
+        assert list(auth._CREDS_CACHE.values()) == [(creds, frozenset(DEFAULT_SCOPES))]
+
+    def test_token_missing_scope_reauthenticates(self, token_file, mocker):
+        """Test that a token without every requested scope is not used."""
+        token_file()
+        manager = AuthManager()
+        mocker.patch.object(manager, "get_credentials_path", side_effect=FileNotFoundError)
+
+        with pytest.raises(auth.AuthenticationError):
+            manager.get_credentials(
+                scopes=DEFAULT_SCOPES + ["https://www.googleapis.com/auth/gmail"]
+            )
+
+    def test_use_cache_false_keeps_unchanged_token(self, token_file, mocker):
+        """Test that reloading an unchanged token.json keeps the cached object."""
+        token_file()
+        manager = AuthManager()
+        first = manager.get_credentials(scopes=DEFAULT_SCOPES)
+        spy = mocker.spy(manager, "get_token_path")
+
+        reloaded = manager.get_credentials(scopes=DEFAULT_SCOPES, use_cache=False)
+
+        spy.assert_called_once()
+        assert reloaded is first
+        assert manager.get_credentials(scopes=DEFAULT_SCOPES) is first
+
+    def test_use_cache_false_replaces_changed_token(self, token_file):
+        """Test that bypassing the cache picks up a replaced token.json."""
+        token_file()
+        manager = AuthManager()
+        first = manager.get_credentials(scopes=DEFAULT_SCOPES)
+        token_file(token="new-access-token")
+
+        reloaded = manager.get_credentials(scopes=DEFAULT_SCOPES, use_cache=False)
+
+        assert reloaded is not first
+        assert reloaded.token == "new-access-token"
+        assert manager.get_credentials(scopes=DEFAULT_SCOPES) is reloaded
+
+    def test_use_cache_false_notices_deleted_token(self, token_file, mocker):
+        """Test that a deleted token is not masked by the cache when bypassing it."""
+        path = token_file()
+        manager = AuthManager()
+        manager.get_credentials(scopes=DEFAULT_SCOPES)
+        path.unlink()
+        mocker.patch.object(manager, "get_credentials_path", side_effect=FileNotFoundError)
+
+        with pytest.raises(auth.AuthenticationError):
+            manager.get_credentials(scopes=DEFAULT_SCOPES, use_cache=False)
+
+    def test_near_expiry_reloads_from_disk(self, token_file):
+        """Test that a cached token inside google-auth's refresh threshold is not returned."""
+        token_file()
+        manager = AuthManager()
+        first = manager.get_credentials(scopes=DEFAULT_SCOPES)
+
+        first.expiry = auth._utcnow() + REFRESH_THRESHOLD - timedelta(seconds=30)
+        second = manager.get_credentials(scopes=DEFAULT_SCOPES)
+
+        assert second is not first
+
+    def test_token_outside_threshold_served_from_cache(self, token_file, mocker):
+        """Test that a cached token just outside the refresh threshold is still returned."""
+        token_file()
+        mocker.patch("google.oauth2.credentials.Credentials.refresh")
+        manager = AuthManager()
+        first = manager.get_credentials(scopes=DEFAULT_SCOPES)
+
+        first.expiry = auth._utcnow() + REFRESH_THRESHOLD + timedelta(seconds=60)
+        second = manager.get_credentials(scopes=DEFAULT_SCOPES)
+        auth._REFRESH_EXECUTOR.submit(lambda: None).result()
+
+        assert second is first
+
+
+class TestBackgroundRefresh:
+    """Test pre-emptive refresh of credentials close to expiry."""
+
+    @staticmethod
+    def _drain_executor():
+        """Wait for queued background refreshes to finish."""
+        auth._REFRESH_EXECUTOR.submit(lambda: None).result()
+
+    def test_stale_token_refreshed_in_background(self, token_file, mocker):
+        """Test that a stale but valid token is returned and refreshed off-thread."""
+        token_file(expires_in=timedelta(minutes=6))
+        refresh = mocker.patch("google.oauth2.credentials.Credentials.refresh")
+        manager = AuthManager()
+
+        creds = manager.get_credentials(scopes=DEFAULT_SCOPES)
+        self._drain_executor()
+
+        assert creds.token == "access-token"
+        refresh.assert_called_once()
+        assert not auth._refresh_in_flight
+
+    def test_fresh_token_not_refreshed(self, token_file, mocker):
+        """Test that tokens outside the refresh window are left alone."""
+        token_file()
+        refresh = mocker.patch("google.oauth2.credentials.Credentials.refresh")
+
+        AuthManager().get_credentials(scopes=DEFAULT_SCOPES)
+        self._drain_executor()
+
+        refresh.assert_not_called()
+
+    def test_refresh_failure_keeps_current_token(self, token_file, mocker):
+        """Test that a failed background refresh does not evict the current token."""
+        token_file(expires_in=timedelta(minutes=6))
+        mocker.patch(
+            "google.oauth2.credentials.Credentials.refresh", side_effect=Exception("network")
+        )
+        manager = AuthManager()
+
+        first = manager.get_credentials(scopes=DEFAULT_SCOPES)
+        self._drain_executor()
+
+        assert not auth._refresh_in_flight
+        assert manager.get_credentials(scopes=DEFAULT_SCOPES) is first
+
+
+class TestConfigDir:
+    """Test profile directory resolution."""
+
+    def test_config_dir_follows_xdg_config_home(self, tmp_path, monkeypatch):
+        """Test that the profile directory honors XDG_CONFIG_HOME without creating it."""
+        monkeypatch.setenv("XDG_CONFIG_HOME", str(tmp_path))
+
+        config_dir = AuthManager().get_config_dir("work")
+
+        assert config_dir == str(tmp_path / "google-personal-mcp" / "profiles" / "work")
+        assert not (tmp_path / "google-personal-mcp").exists()
+
+
+class TestCredentialsPath:
+    """Test credentials.json resolution."""
+
+    def test_missing_credentials_raises(self, tmp_path, monkeypatch):
+        """Test that a missing credentials.json raises FileNotFoundError."""
+        monkeypatch.setenv("XDG_CONFIG_HOME", str(tmp_path))
+        monkeypatch.delenv("GOOGLE_PERSONAL_CREDENTIALS_JSON", raising=False)
+
+        with pytest.raises(FileNotFoundError):
+            AuthManager().get_credentials_path()
+
+    def test_resolved_path_is_memoized(self, tmp_path, monkeypatch, mocker):
+        """Test that a successful lookup is not probed again."""
+        monkeypatch.setenv("XDG_CONFIG_HOME", str(tmp_path))
+        monkeypatch.delenv("GOOGLE_PERSONAL_CREDENTIALS_JSON", raising=False)
+        profile_dir = tmp_path / "google-personal-mcp" / "profiles" / "default"
+        profile_dir.mkdir(parents=True)
+        (profile_dir / "credentials.json").write_text("{}")
+        manager = AuthManager()
+
+        path = manager.get_credentials_path()
+        stat = mocker.patch("google_mcp_core.auth.os.stat")
+
+        assert manager.get_credentials_path() == path
+        stat.assert_not_called()
+
+    def test_env_credentials_written_once(self, monkeypatch):
+        """Test that env var credentials are written to a single temp file."""
+        monkeypatch.setenv("GOOGLE_PERSONAL_CREDENTIALS_JSON", '{"installed": {}}')
+        manager = AuthManager()
+
+        path = manager.get_credentials_path()
+        try:
+            assert manager.get_credentials_path() == path
+        finally:
+            os.remove(path)
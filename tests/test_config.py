@@ -3,6 +3,7 @@
 import os
 import json
 import pytest
+from pydantic import ValidationError
 
 from google_mcp_core.config import (
     load_env_file,
@@ -259,3 +260,93 @@ class TestConfigManager:
         manager2 = ConfigManager(str(config_file))
         assert "new_sheet" in manager2.config.sheets
         assert manager2.config.sheets["new_sheet"].id == "new_id"
+
+    def test_get_allowed_folder_ids_by_profile(self, tmp_path):
+        """Test allowed folder IDs are grouped by profile."""
+        config_file = tmp_path / "config.json"
+        config_data = {
+            "sheets": {},
+            "drive_folders": {
+                "docs": {"id": "folder1", "profile": "default"},
+                "photos": {"id": "folder2", "profile": "personal"},
+                "notes": {"id": "folder3", "profile": "default"},
+            },
+        }
+        config_file.write_text(json.dumps(config_data))
+
+        manager = ConfigManager(str(config_file))
+
+        assert manager.get_allowed_folder_ids("default") == ["folder1", "folder3"]
+        assert manager.get_allowed_folder_ids("personal") == ["folder2"]
+        assert manager.get_allowed_folder_ids("unknown") == []
+        assert manager.get_allowed_folder_ids() == ["folder1", "folder2", "folder3"]
+
+    def test_resource_config_is_immutable(self):
+        """Test that resource entries cannot be modified in place."""
+        resource = ResourceConfig(id="sheet_123")
+
+        with pytest.raises(ValidationError):
+            resource.id = "other"
+
+    def test_save_and_load_without_orjson(self, tmp_path, monkeypatch):
+        """Test the stdlib json fallback round-trips the configuration."""
+        from google_mcp_core.utils import jsonio
+
+        monkeypatch.setattr(jsonio, "orjson", None)
+        config_file = tmp_path / "config.json"
+
+        manager = ConfigManager(str(config_file))
+        manager.config.sheets["new_sheet"] = ResourceConfig(id="new_id", description="Café")
+        manager.save_config()
+
+        manager2 = ConfigManager(str(config_file))
+        assert manager2.config.sheets["new_sheet"].description == "Café"
+
+
+class TestConfigReload:
+    """Test reloading configuration when the file changes on disk."""
+
+    @staticmethod
+    def _write(config_file, config_data, mtime_offset=0):
+        config_file.write_text(json.dumps(config_data))
+        stat = os.stat(config_file)
+        os.utime(config_file, ns=(stat.st_atime_ns, stat.st_mtime_ns + mtime_offset))
+
+    def test_reload_on_mtime_change(self, tmp_path):
+        """Test that getters pick up edits made after construction."""
+        config_file = tmp_path / "config.json"
+        self._write(config_file, {"drive_folders": {"a": {"id": "folder1"}}})
+        manager = ConfigManager(str(config_file))
+
+        self._write(
+            config_file,
+            {"drive_folders": {"a": {"id": "folder1"}, "b": {"id": "folder2"}}},
+            mtime_offset=1_000_000_000,
+        )
+
+        assert manager.get_allowed_folder_ids("default") == ["folder1", "folder2"]
+        assert "b" in manager.list_folders()
+
+    def test_no_reload_when_unchanged(self, tmp_path, mocker):
+        """Test that an unchanged file is not re-read."""
+        config_file = tmp_path / "config.json"
+        self._write(config_file, {"sheets": {"prompts": {"id": "sheet_123"}}})
+        manager = ConfigManager(str(config_file))
+
+        spy = mocker.spy(ConfigManager, "_load_config")
+        manager.get_sheet_resource("prompts")
+        manager.list_sheets()
+
+        spy.assert_not_called()
+
+    def test_invalid_edit_keeps_previous_config(self, tmp_path):
+        """Test that a broken edit does not discard the loaded configuration."""
+        config_file = tmp_path / "config.json"
+        self._write(config_file, {"sheets": {"prompts": {"id": "sheet_123"}}})
+        manager = ConfigManager(str(config_file))
+
+        config_file.write_text("{invalid json}")
+        stat = os.stat(config_file)
+        os.utime(config_file, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+
+        assert manager.get_sheet_resource("prompts").id == "sheet_123"
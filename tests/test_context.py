@@ -0,0 +1,106 @@
+"""Tests for GoogleContext sharing."""
+
+from datetime import timedelta
+
+from google_mcp_core import auth
+from google_mcp_core.auth import AuthManager
+from google_mcp_core.context import DEFAULT_SCOPES, get_context
+
+
+class TestGetContext:
+    """Test reuse of contexts across calls."""
+
+    def test_same_profile_and_scopes_shared(self):
+        """Test that repeated lookups return the same context."""
+        assert get_context("default") is get_context("default")
+
+    def test_default_scopes_applied(self):
+        """Test that omitting scopes uses the default Sheets and Drive scopes."""
+        assert get_context("default") is get_context("default", scopes=list(DEFAULT_SCOPES))
+        assert get_context("default").scopes == DEFAULT_SCOPES
+
+    def test_scope_order_ignored(self):
+        """Test that scopes are compared as a set."""
+        scopes = ["scope-a", "scope-b"]
+        assert get_context("default", scopes) is get_context("default", scopes[::-1])
+
+    def test_distinct_profiles_and_scopes(self):
+        """Test that different profiles or scopes get separate contexts."""
+        base = get_context("default")
+
+        assert get_context("work") is not base
+        assert get_context("default", scopes=["scope-a"]) is not base
+        assert get_context("work").profile == "work"
+
+
+class TestSharedTransport:
+    """Test that services of one context share an HTTP transport."""
+
+    def test_services_share_http(self, mocker):
+        """Test that Sheets and Drive are built on the same authorized transport."""
+        build = mocker.patch("google_mcp_core.context.build")
+        context = get_context("default")
+        mocker.patch.object(context.auth_manager, "get_credentials")
+
+        context.sheets
+        context.drive
+
+        transports = [call.kwargs["http"] for call in build.call_args_list]
+        assert len(transports) == 2
+        assert transports[0] is transports[1] is context.http
+
+    def test_http_follows_reloaded_credentials(self, mocker):
+        """Test that the transport is rebuilt around a replaced Credentials object."""
+        context = get_context("default")
+        get_credentials = mocker.patch.object(context.auth_manager, "get_credentials")
+
+        first = context.http
+        assert context.http is first
+        reloaded = mocker.Mock()
+        get_credentials.return_value = reloaded
+
+        assert context.http is not first
+        assert context.http.credentials is reloaded
+
+
+class TestCredentialResolution:
+    """Test that shared contexts keep going through AuthManager."""
+
+    def test_stale_credentials_schedule_refresh_on_later_access(self, token_file, mocker):
+        """Test that a long-lived context triggers a background refresh near expiry."""
+        token_file()
+        refresh = mocker.patch("google.oauth2.credentials.Credentials.refresh")
+        schedule = mocker.spy(AuthManager, "_schedule_refresh")
+        context = get_context("default")
+
+        creds = context.credentials
+        creds.expiry = auth._utcnow() + timedelta(minutes=6)
+        assert get_context("default").credentials is creds
+        auth._REFRESH_EXECUTOR.submit(lambda: None).result()
+
+        assert schedule.call_count == 2
+        refresh.assert_called_once()
+
+    def test_repeated_health_checks_keep_transport(self, token_file):
+        """Test that reloading an unchanged token does not rebuild shared transports."""
+        token_file()
+        context = get_context("default")
+        http = context.http
+
+        AuthManager().get_credentials("default", DEFAULT_SCOPES, use_cache=False)
+        AuthManager().get_credentials("default", DEFAULT_SCOPES, use_cache=False)
+
+        assert context.http is http
+
+    def test_services_rebuilt_when_credentials_change(self, mocker):
+        """Test that clients bound to replaced credentials are not reused."""
+        build = mocker.patch("google_mcp_core.context.build")
+        context = get_context("default")
+        get_credentials = mocker.patch.object(context.auth_manager, "get_credentials")
+
+        first = context.drive
+        assert context.drive is first
+        get_credentials.return_value = mocker.Mock()
+        context.drive
+
+        assert build.call_count == 2
@@ -0,0 +1,162 @@
+"""Tests for the Drive service wrapper."""
+
+import pytest
+
+from google_mcp_core.drive import DriveService
+
+
+@pytest.fixture
+def drive_api(mock_google_context):
+    """The mocked Drive API client behind a DriveService."""
+    return mock_google_context.drive
+
+
+class TestListAllFiles:
+    """Test pagination of list_all_files."""
+
+    def test_follows_next_page_token(self, mock_google_context, drive_api):
+        """Test that every page is fetched and files are yielded in order."""
+        drive_api.files.return_value.list.return_value.execute.side_effect = [
+            {"files": [{"id": "1"}, {"id": "2"}], "nextPageToken": "page2"},
+            {"files": [{"id": "3"}], "nextPageToken": "page3"},
+            {"files": [{"id": "4"}]},
+        ]
+        service = DriveService(mock_google_context)
+
+        files = list(service.list_all_files(pageSize=2))
+
+        assert [f["id"] for f in files] == ["1", "2", "3", "4"]
+        page_tokens = [
+            call.kwargs["pageToken"] for call in drive_api.files.return_value.list.call_args_list
+        ]
+        assert page_tokens == [None, "page2", "page3"]
+
+    def test_pages_fetched_on_dedicated_transport(self, mock_google_context, drive_api):
+        """Test that page requests do not go through the context's shared transport."""
+        execute = drive_api.files.return_value.list.return_value.execute
+        execute.side_effect = [{"files": [], "nextPageToken": "page2"}, {"files": []}]
+        service = DriveService(mock_google_context)
+
+        list(service.list_all_files())
+
+        transports = [call.kwargs["http"] for call in execute.call_args_list]
+        assert len(transports) == 2
+        assert transports[0] is transports[1]
+        assert transports[0] is not mock_google_context.http
+        assert transports[0].credentials is mock_google_context.credentials
+
+    def test_empty_listing(self, mock_google_context, drive_api):
+        """Test that an empty drive yields nothing."""
+        drive_api.files.return_value.list.return_value.execute.return_value = {}
+        service = DriveService(mock_google_context)
+
+        assert list(service.list_all_files()) == []
+
+
+class TestVerifyAccess:
+    """Test folder allow-list enforcement."""
+
+    def test_no_allowed_folders_denies(self, mock_google_context):
+        """Test that Drive access is disabled without allowed folders."""
+        service = DriveService(mock_google_context)
+
+        with pytest.raises(PermissionError):
+            service._verify_access(parent_id="folder1")
+
+    def test_parent_outside_allowed_folders_denied(self, mock_google_context, drive_api):
+        """Test that files outside the allowed folders are rejected."""
+        drive_api.files.return_value.get.return_value.execute.return_value = {"parents": ["other"]}
+        service = DriveService(mock_google_context, allowed_folder_ids=["folder1"])
+
+        with pytest.raises(PermissionError, match="not allowed"):
+            service._verify_access(file_id="file1")
+
+    def test_parents_cached_between_calls(self, mock_google_context, drive_api):
+        """Test that repeated checks for one file issue a single parents lookup."""
+        get = drive_api.files.return_value.get
+        get.return_value.execute.return_value = {"parents": ["folder1"]}
+        service = DriveService(mock_google_context, allowed_folder_ids=["folder1"])
+
+        service._verify_access(file_id="file1")
+        service._verify_access(file_id="file1")
+
+        get.assert_called_once_with(fileId="file1", fields="parents")
+
+    def test_parent_cache_expires(self, mock_google_context, drive_api, mocker):
+        """Test that cached parents are re-fetched after the TTL."""
+        get = drive_api.files.return_value.get
+        get.return_value.execute.return_value = {"parents": ["folder1"]}
+        clock = mocker.patch("google_mcp_core.drive.time.monotonic", return_value=1000.0)
+        service = DriveService(mock_google_context, allowed_folder_ids=["folder1"])
+
+        service._verify_access(file_id="file1")
+        clock.return_value = 1000.0 + 301
+        service._verify_access(file_id="file1")
+
+        assert get.call_count == 2
+        assert list(service._parent_cache) == ["file1"]
+
+    def test_expired_entry_dropped_when_refetch_fails(self, mock_google_context, drive_api, mocker):
+        """Test that an expired entry does not linger after a failed re-check."""
+        get = drive_api.files.return_value.get
+        get.return_value.execute.return_value = {"parents": ["folder1"]}
+        clock = mocker.patch("google_mcp_core.drive.time.monotonic", return_value=1000.0)
+        service = DriveService(mock_google_context, allowed_folder_ids=["folder1"])
+
+        service._verify_access(file_id="file1")
+        clock.return_value = 1000.0 + 301
+        get.return_value.execute.side_effect = Exception("404")
+
+        with pytest.raises(PermissionError):
+            service._verify_access(file_id="file1")
+        assert "file1" not in service._parent_cache
+
+    def test_parent_cache_evicts_least_recently_used(self, mock_google_context, drive_api, mocker):
+        """Test that the cache is capped and evicts the least recently checked file."""
+        mocker.patch("google_mcp_core.drive.PARENT_CACHE_SIZE", 2)
+        drive_api.files.return_value.get.return_value.execute.return_value = {
+            "parents": ["folder1"]
+        }
+        service = DriveService(mock_google_context, allowed_folder_ids=["folder1"])
+
+        service._verify_access(file_id="file1")
+        service._verify_access(file_id="file2")
+        service._verify_access(file_id="file1")
+        service._verify_access(file_id="file3")
+
+        assert list(service._parent_cache) == ["file1", "file3"]
+
+    def test_remove_file_evicts_cache(self, mock_google_context, drive_api):
+        """Test that a deleted file's parents are not kept."""
+        drive_api.files.return_value.get.return_value.execute.return_value = {
+            "parents": ["folder1"]
+        }
+        service = DriveService(mock_google_context, allowed_folder_ids=["folder1"])
+
+        service.remove_file("file1")
+
+        assert "file1" not in service._parent_cache
+
+
+class TestDownloadFile:
+    """Test file downloads."""
+
+    def test_download_uses_large_chunks(self, mock_google_context, drive_api, tmp_path, mocker):
+        """Test that downloads request large chunks and write the file."""
+        drive_api.files.return_value.get.return_value.execute.return_value = {
+            "parents": ["folder1"]
+        }
+        downloader_cls = mocker.patch("google_mcp_core.drive.MediaIoBaseDownload")
+
+        def next_chunk():
+            downloader_cls.call_args.args[0].write(b"content")
+            return mocker.Mock(progress=mocker.Mock(return_value=1.0)), True
+
+        downloader_cls.return_value.next_chunk.side_effect = next_chunk
+        service = DriveService(mock_google_context, allowed_folder_ids=["folder1"])
+        local_path = tmp_path / "out.bin"
+
+        service.download_file("file1", str(local_path))
+
+        assert downloader_cls.call_args.kwargs["chunksize"] == 16 * 1024 * 1024
+        assert local_path.read_bytes() == b"content"